@@ -1,10 +1,17 @@
+import copy
+import functools
+import mmap
 import os
+import shutil
+import struct
 import zipfile
 import sys
 import re
-from io import BytesIO
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape as _xml_escape
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from lxml import etree
@@ -15,90 +22,391 @@ APP_NAME = "CoTag"
 # best-effort icon path (optional)
 ICON_PATH = Path(__file__).with_name("icon.png")
 
+# ComicInfo.xml tags read into FileItem.meta
+COMICINFO_TAGS = ("SeriesGroup", "Series", "Title", "Volume", "Number", "Year", "Month", "Day", "Penciller", "Inker")
+
+# editable metadata fields (Author maps to both Penciller and Inker)
+FIELD_KEYS = ("SeriesGroup", "Series", "Title", "Volume", "Number", "Year", "Month", "Day", "Author")
+
+# archive entries treated as pages
+IMAGE_EXTS = frozenset({'png', 'jpg', 'jpeg', 'webp', 'bmp', 'gif'})
+
+# archive entries holding metadata; matched case-insensitively at the end of the name
+_COMICINFO_NAME = 'comicinfo.xml'
+
+# read size used when copying archive entries
+_COPY_CHUNK_SIZE = 1 << 20
+
+# digit runs in filenames, for natural sorting
+_NAT_RE = re.compile(r"(\d+)")
+
+# characters XML 1.0 does not allow in a document, escaped or not
+_XML_ILLEGAL_RE = re.compile("[^\x09\x0a\x0d\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+
+def _is_comicinfo(name: str) -> bool:
+    """True for ComicInfo.xml entries, in any folder and letter case."""
+    # lower() only the tail rather than the whole (possibly long) entry name
+    return name[-len(_COMICINFO_NAME):].lower() == _COMICINFO_NAME
+
+
+def _is_mac_junk(name: str) -> bool:
+    """True for the resource-fork entries macOS adds when zipping (``__MACOSX/``
+    and AppleDouble ``._*`` files); they share the real images' extensions."""
+    return name.startswith('__MACOSX/') or name.rpartition('/')[2].startswith('._')
+
+
+@functools.lru_cache(maxsize=4096)
+def _natural_key(s: str) -> Tuple:
+    """Sort key that orders numeric parts numerically (1, 2, ..., 10)."""
+    # split() with a capturing group alternates text / digit runs, so every
+    # odd slot is a number; case-fold the whole name once up front
+    parts: list = _NAT_RE.split(s.casefold())
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
 
 class FileItem:
     """Lightweight container for a file entry."""
+    # one instance per loaded file; slots keep large lists small and attribute access cheap
+    __slots__ = ('path', 'meta', 'saved_meta', 'has_comicinfo', 'meta_loaded', 'dirty',
+                 'row', 'size', 'size_str', 'mtime_ns')
+
     def __init__(self, path: Path):
         self.path: Path = path
         self.meta: Dict[str, str] = {}
         self.saved_meta: Dict[str, str] = {}
         self.has_comicinfo: bool = False
+        # ComicInfo.xml is parsed lazily, the first time the file is selected
+        self.meta_loaded: bool = False
         self.dirty: bool = False
+        # row index in the file table; kept in sync by MainWindow._rebuild_table
+        self.row: int = -1
+        # cached os.stat() results; refreshed after load, save and rename
+        self.size: int = -1
+        self.size_str: str = ""
+        self.mtime_ns: int = 0
+
+    def refresh_stat(self, st: Optional[os.stat_result] = None) -> None:
+        """Re-read size and mtime of the file with a single stat call.
+
+        A ``stat_result`` obtained elsewhere (e.g. from os.scandir) may be passed in.
+        """
+        if st is None:
+            try:
+                st = os.stat(self.path)
+            except Exception:
+                self.size, self.size_str, self.mtime_ns = -1, "", 0
+                return
+        self.size = st.st_size
+        self.size_str = f"{st.st_size / (1024.0 * 1024.0):.1f} MB"
+        self.mtime_ns = st.st_mtime_ns
+
+
+class ZipIndex(NamedTuple):
+    """What CoTag needs to know about an archive's entry list."""
+    comicinfo: Optional[str]
+    images: Tuple[str, ...]  # page names in natural sort order; images[0] is the cover
+
+
+# ZipIndex per (path, mtime_ns, size); also used from worker threads, hence the lock
+_zip_index_cache: "OrderedDict[Tuple[str, int, int], ZipIndex]" = OrderedDict()
+_zip_index_lock = threading.Lock()
+_ZIP_INDEX_MAX = 512
+
 
+def _zip_index(z: zipfile.ZipFile) -> ZipIndex:
+    """Classify the entries of an open archive in a single pass, with caching.
 
-def read_comicinfo_from_zip(path: Path) -> Optional[etree._Element]:
-    """Return the root Element of ComicInfo.xml inside the zip, or None."""
+    The cache key includes the file's mtime and size, so a rewritten archive
+    is re-indexed automatically (the size catches rewrites that coarse
+    timestamps, e.g. FAT32's 2 s, don't).
+    """
     try:
-        with zipfile.ZipFile(str(path), 'r') as z:
-            # find ComicInfo.xml (case-insensitive)
-            nam = None
-            for n in z.namelist():
-                if n.lower().endswith('comicinfo.xml'):
-                    nam = n
-                    break
-            if not nam:
-                return None
-            data = z.read(nam)
-            root = etree.fromstring(data)
-            return root
+        st = os.fstat(z.fp.fileno())
+        key = (str(z.filename), st.st_mtime_ns, st.st_size)
     except Exception:
+        key = None
+    if key is not None:
+        with _zip_index_lock:
+            idx = _zip_index_cache.get(key)
+            if idx is not None:
+                _zip_index_cache.move_to_end(key)
+                return idx
+
+    comicinfo = None
+    images = []
+    for zi in z.infolist():
+        name = zi.filename
+        if zi.is_dir() or _is_mac_junk(name):
+            continue
+        if name.rpartition('.')[2].lower() in IMAGE_EXTS:
+            images.append(name)
+        elif comicinfo is None and _is_comicinfo(name):
+            comicinfo = name
+    images.sort(key=_natural_key)
+    idx = ZipIndex(comicinfo, tuple(images))
+
+    if key is not None:
+        with _zip_index_lock:
+            _zip_index_cache[key] = idx
+            while len(_zip_index_cache) > _ZIP_INDEX_MAX:
+                _zip_index_cache.popitem(last=False)
+    return idx
+
+
+def _read_comicinfo(z: zipfile.ZipFile) -> Optional[Dict[str, str]]:
+    """Return the metadata fields of ComicInfo.xml in an open archive, or None."""
+    # find ComicInfo.xml (case-insensitive)
+    nam = _zip_index(z).comicinfo
+    if not nam:
         return None
+    out: Dict[str, str] = {}
+    depth = 0
+    with z.open(nam) as stream:
+        # stream the document and discard every element once it has ended, so large
+        # blocks such as <Pages> never build up in memory
+        for event, el in etree.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                continue
+            # only direct children of the root count (not e.g. a <Title> nested
+            # somewhere deeper); the first occurrence of a field wins
+            if depth == 2 and el.tag in COMICINFO_TAGS and el.tag not in out and el.text:
+                out[el.tag] = el.text
+            depth -= 1
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+    author = out.get("Penciller") or out.get("Inker")
+    if author:
+        out["Author"] = author
+    return out
+
 
+def _local_header_tail(header: bytes, zi: zipfile.ZipInfo) -> int:
+    """Check an entry's local file header and return the length of the name and
+    extra field that follow it (the payload starts right after them)."""
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header: {zi.filename!r}")
+    fh = struct.unpack(zipfile.structFileHeader, header)
+    return fh[zipfile._FH_FILENAME_LENGTH] + fh[zipfile._FH_EXTRA_FIELD_LENGTH]
 
-def write_comicinfo_to_zip(path: Path, root: etree._Element) -> bool:
+
+def _read_member(z: zipfile.ZipFile, name: str, mm: Optional[mmap.mmap] = None) -> QtCore.QByteArray:
+    """Return the contents of one archive entry as a QByteArray.
+
+    Qt image loaders take a QByteArray as-is but copy Python bytes into
+    one, so the entry is decompressed in chunks straight into an array of
+    its final size; the data never exists twice in memory.
+
+    With ``mm``, a mapping of the whole archive, an uncompressed entry
+    (the usual case for JPEG pages) is copied out of the mapping in one go
+    without going through zipfile; its CRC is not checked then, a damaged
+    page simply fails to decode.
+    """
+    info = z.getinfo(name)
+    if mm is not None and info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+        start = info.header_offset + zipfile.sizeFileHeader
+        start += _local_header_tail(mm[info.header_offset:start], info)
+        end = start + info.file_size
+        if end <= len(mm):
+            ba = QtCore.QByteArray(info.file_size, 0)
+            with memoryview(ba) as mv, memoryview(mm) as src:
+                mv[:] = src[start:end]
+            return ba
+    ba = QtCore.QByteArray(info.file_size, 0)
+    pos = 0
+    with z.open(info) as fh, memoryview(ba) as mv:
+        while pos < info.file_size:
+            n = fh.readinto(mv[pos:pos + _COPY_CHUNK_SIZE])
+            if not n:
+                break
+            pos += n
+    if pos < info.file_size:
+        ba.truncate(pos)
+    return ba
+
+
+def _read_cover(z: zipfile.ZipFile) -> Optional[QtCore.QByteArray]:
+    """Return raw bytes of the cover image in an open archive, or None.
+
+    The cover is the image whose name sorts first (e.g. "cover.jpg" or
+    "000.jpg"); only that entry is decompressed.
+    """
+    images = _zip_index(z).images
+    if not images:
+        return None
+    return _read_member(z, images[0])
+
+
+# parsed ComicInfo metadata per (path, mtime_ns, size), so adding the same files
+# again skips the archive; a rewritten file gets a new key and is parsed afresh
+_meta_cache: "OrderedDict[Tuple[str, int, int], Optional[Dict[str, str]]]" = OrderedDict()
+_META_CACHE_MAX = 2048
+_MISS = object()
+
+
+def _forget_archive(path: Path) -> None:
+    """Drop everything cached for ``path``.
+
+    Called after the app itself rewrites the archive: a same-size rewrite
+    within the filesystem's timestamp granularity keeps both mtime and size.
+    """
+    name = str(path)
+    with _zip_index_lock:
+        for key in [k for k in _zip_index_cache if k[0] == name]:
+            del _zip_index_cache[key]
+    for key in [k for k in _meta_cache if k[0] == name]:
+        del _meta_cache[key]
+
+
+def read_archive_info(path: Path, mtime_ns: int = 0, size: int = -1) -> Optional[Dict[str, str]]:
+    """Return the archive's ComicInfo metadata, or None.
+
+    With a known ``mtime_ns`` (and ``size``) the metadata is cached and a
+    cache hit doesn't open the archive at all. The returned dict is always a
+    fresh copy the caller may modify. The archive is closed again before
+    returning. The cover is not read here; that is left to the thumbnail
+    worker so the GUI thread never inflates images.
+
+    An archive that can't be opened raises (OSError, zipfile.BadZipFile), so
+    the caller can tell it apart from one without ComicInfo.xml and retry.
+    """
+    key = (str(path), mtime_ns, size) if mtime_ns else None
+    meta = _meta_cache.get(key, _MISS) if key is not None else _MISS
+    if meta is not _MISS:
+        _meta_cache.move_to_end(key)
+        return dict(meta) if meta is not None else None
+    with zipfile.ZipFile(str(path), 'r') as z:
+        try:
+            meta = _read_comicinfo(z)
+            if key is not None:
+                _meta_cache[key] = meta
+                while len(_meta_cache) > _META_CACHE_MAX:
+                    _meta_cache.popitem(last=False)
+        except Exception:
+            meta = None
+        return dict(meta) if meta is not None else None
+
+
+def _copy_raw_entry(src: zipfile.ZipFile, zi: zipfile.ZipInfo, out: zipfile.ZipFile) -> None:
+    """Copy one archive entry into ``out`` as-is, without decompressing it."""
+    # locate the entry payload behind its local file header
+    src.fp.seek(zi.header_offset)
+    header = src.fp.read(zipfile.sizeFileHeader)
+    src.fp.seek(_local_header_tail(header, zi), 1)
+
+    # CRC and sizes are known up front, so no trailing data descriptor is needed
+    info = copy.copy(zi)
+    info.flag_bits &= ~0x08
+    info.extra = zipfile._strip_extra(zi.extra, (1,))
+    out._writecheck(info)
+    info.header_offset = out.fp.tell()
+    out.fp.write(info.FileHeader())
+    remaining = zi.compress_size
+    while remaining > 0:
+        chunk = src.fp.read(min(remaining, _COPY_CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated entry: {zi.filename!r}")
+        out.fp.write(chunk)
+        remaining -= len(chunk)
+    out.filelist.append(info)
+    out.NameToInfo[info.filename] = info
+    out.start_dir = out.fp.tell()
+
+
+def _build_xml_bytes(cur: Dict[str, str]) -> bytes:
+    """Serialize edited metadata to ComicInfo.xml bytes.
+
+    The schema is a fixed, flat list of text elements, so the document is
+    written directly instead of going through an lxml tree. Raises
+    ValueError if a value holds characters XML cannot represent.
+    """
+    def tag(name: str, value: Optional[str]) -> bytes:
+        if not value or value == "<개별값>":
+            return b""
+        if _XML_ILLEGAL_RE.search(str(value)):
+            raise ValueError(name)
+        # no indentation or line breaks: whitespace only adds bytes nothing reads
+        return f"<{name}>{_xml_escape(str(value))}</{name}>".encode('utf-8')
+
+    author = cur.get("Author", "")
+    parts = [tag(k, cur.get(k, "")) for k in FIELD_KEYS if k != "Author"]
+    parts.append(tag("Penciller", author))
+    parts.append(tag("Inker", author))
+    return (b'<?xml version="1.0" encoding="utf-8"?><ComicInfo>'
+            + b"".join(parts) + b"</ComicInfo>")
+
+
+def write_comicinfo_to_zip(path: Path, xml: bytes) -> bool:
     """Write ComicInfo.xml into the archive, returning True on success.
 
-    This rebuilds the archive in-memory and overwrites the original file.
+    The archive is streamed entry by entry into a sibling temp file which then
+    replaces the original, so a failed or interrupted save never leaves a
+    half-written archive behind. Existing entries are copied with their
+    compressed bytes untouched; only ComicInfo.xml itself is compressed.
     """
+    tmp = path.with_suffix(path.suffix + '.tmp')
     try:
-        # gather existing entries except ComicInfo.xml
-        with zipfile.ZipFile(str(path), 'r') as z:
-            entries = [(n, z.read(n)) for n in z.namelist() if not n.lower().endswith('comicinfo.xml')]
-
-        bio = BytesIO()
-        compression = zipfile.ZIP_DEFLATED if 'ZIP_DEFLATED' in dir(zipfile) else zipfile.ZIP_STORED
-        with zipfile.ZipFile(bio, 'w', compression=compression) as out:
-            for n, b in entries:
-                out.writestr(n, b)
-            # write ComicInfo.xml at root
-            xml_bytes = etree.tostring(root, pretty_print=True, encoding='utf-8', xml_declaration=True)
-            out.writestr('ComicInfo.xml', xml_bytes)
-
-        path.write_bytes(bio.getvalue())
+        with zipfile.ZipFile(str(path), 'r') as z, open(tmp, 'wb') as fp:
+            with zipfile.ZipFile(fp, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6, allowZip64=True) as out:
+                out.comment = z.comment
+                # copy existing entries except ComicInfo.xml, keeping each one's compression
+                for zi in z.infolist():
+                    if _is_comicinfo(zi.filename):
+                        continue
+                    _copy_raw_entry(z, zi, out)
+                # write ComicInfo.xml at root
+                out.writestr('ComicInfo.xml', xml)
+            # make sure the new archive is on disk before it replaces the original
+            fp.flush()
+            os.fsync(fp.fileno())
+
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
         return True
     except Exception:
+        tmp.unlink(missing_ok=True)
         return False
 
 
-def get_first_image_from_zip(path: Path) -> Optional[bytes]:
-    """Return raw bytes of the first image file inside the zip, or None."""
-    try:
-        with zipfile.ZipFile(str(path), 'r') as z:
-            for n in z.namelist():
-                lower = n.lower()
-                if lower.endswith(('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif')):
-                    return z.read(n)
-    except Exception:
-        return None
-    return None
+def _stat_paths(paths: List[Path]) -> Dict[Path, os.stat_result]:
+    """Stat many files, listing each parent directory once where that helps.
+
+    On Windows DirEntry.stat() is served from the directory listing itself, so
+    a folder holding several of the files costs one scan instead of a stat
+    call per file. Single files, and names missing from the listing, fall
+    back to os.stat.
+    """
+    out: Dict[Path, os.stat_result] = {}
+    by_parent: Dict[Path, List[Path]] = {}
+    for p in paths:
+        by_parent.setdefault(p.parent, []).append(p)
+    for parent, group in by_parent.items():
+        entries: Dict[str, os.DirEntry] = {}
+        if len(group) > 1:
+            try:
+                with os.scandir(parent) as it:
+                    entries = {e.name: e for e in it}
+            except Exception:
+                entries = {}
+        for p in group:
+            try:
+                e = entries.get(p.name)
+                out[p] = e.stat() if e is not None else os.stat(p)
+            except Exception:
+                continue
+    return out
 
 
-def get_image_bytes_list_from_zip(path: Path) -> List[bytes]:
-    """Return raw bytes of all image files inside the zip in archive order."""
-    out: List[bytes] = []
+def get_first_image_from_zip(path: Path) -> Optional[QtCore.QByteArray]:
+    """Return raw bytes of the cover image inside the zip, or None."""
     try:
         with zipfile.ZipFile(str(path), 'r') as z:
-            for n in z.namelist():
-                lower = n.lower()
-                if lower.endswith(('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif')):
-                    try:
-                        out.append(z.read(n))
-                    except Exception:
-                        # skip unreadable entries
-                        continue
+            return _read_cover(z)
     except Exception:
-        return []
-    return out
+        return None
 
 
 class ClickableLabel(QtWidgets.QLabel):
@@ -131,16 +439,182 @@ class ClickableLabel(QtWidgets.QLabel):
         super().wheelEvent(ev)
 
 
+def _paint_ready(img: QtGui.QImage) -> QtGui.QImage:
+    """Convert a decoded image to the format the raster paint engine uses natively.
+
+    Meant for worker threads: QPixmap.fromImage() on the GUI thread then has
+    no format conversion left to do, and neither do later paints.
+    """
+    if img.isNull():
+        return img
+    fmt = QtGui.QImage.Format_ARGB32_Premultiplied if img.hasAlphaChannel() else QtGui.QImage.Format_RGB32
+    return img if img.format() == fmt else img.convertToFormat(fmt)
+
+
+def _scale_image(img: QtGui.QImage, size: QtCore.QSize) -> QtGui.QImage:
+    """Smooth-scale ``img`` to fit ``size``, cheaply when shrinking a lot.
+
+    Smooth scaling costs O(source pixels), so large sources are first
+    reduced to twice the target with fast scaling and only that is
+    smoothed; the result looks the same at thumbnail size.
+    """
+    if img.width() > 2 * size.width() or img.height() > 2 * size.height():
+        img = img.scaled(size * 2, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
+    return img.scaled(size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+
+
+class _ThumbSignals(QtCore.QObject):
+    # (request id, decoded cover, whether the archive contained an image)
+    ready = QtCore.Signal(int, QtGui.QImage, bool)
+
+
+class _ThumbTask(QtCore.QRunnable):
+    """Extract and decode an archive's cover on a worker thread.
+
+    The cover is decoded straight at thumbnail size via QImageReader, which
+    lets JPEG skip most of the full-resolution decode work. Only QImage is
+    used here; QPixmap must be created on the GUI thread.
+    """
+    def __init__(self, req: int, path: Path, size: QtCore.QSize, signals: _ThumbSignals):
+        super().__init__()
+        self._req = req
+        self._path = path
+        self._size = QtCore.QSize(size)
+        self._signals = signals
+
+    def run(self) -> None:
+        data = None
+        img = QtGui.QImage()
+        # always report back: MainWindow holds saves of this archive until then
+        try:
+            data = get_first_image_from_zip(self._path)
+            if data:
+                buf = QtCore.QBuffer()
+                buf.setData(data)
+                buf.open(QtCore.QIODevice.ReadOnly)
+                rd = QtGui.QImageReader(buf)
+                rd.setAutoTransform(True)
+                # rd.size() is the stored size; an EXIF rotation by 90° swaps it on display
+                rotated = bool(rd.transformation() & QtGui.QImageIOHandler.TransformationRotate90)
+                orig = rd.size().transposed() if rotated else rd.size()
+                scale = orig.isValid() and not self._size.isEmpty()
+                if scale:
+                    # a cover already within a pixel of the thumbnail size is used as decoded
+                    fit = orig.scaled(self._size, QtCore.Qt.KeepAspectRatio)
+                    scale = abs(orig.width() - fit.width()) > 1 or abs(orig.height() - fit.height()) > 1
+                if scale and rd.supportsOption(QtGui.QImageIOHandler.ScaledSize):
+                    # scale for thumbnail area while preserving aspect ratio; JPEG does this during decoding.
+                    # The scaled size applies before the transform, so it is given in stored orientation
+                    rd.setScaledSize(fit.transposed() if rotated else fit)
+                    scale = False
+                img = rd.read()
+                if scale and not img.isNull():
+                    # other formats would be smooth-scaled from full size by QImageReader
+                    img = _scale_image(img, self._size)
+                img = _paint_ready(img)
+        except Exception:
+            img = QtGui.QImage()
+        self._signals.ready.emit(self._req, img, bool(data))
+
+
+def _read_page_image(z: Optional[zipfile.ZipFile], name: str,
+                     data: Optional[QtCore.QByteArray] = None,
+                     mm: Optional[mmap.mmap] = None) -> QtGui.QImage:
+    """Read and decode one page; a null QImage if that fails.
+
+    ``data`` may hold the page bytes if they were read already; ``mm`` is
+    passed on to _read_member. Safe off the GUI thread: zipfile serializes
+    access to the shared file handle, each member stream keeps its own
+    position, and the mapping is only read.
+    """
+    img = QtGui.QImage()
+    try:
+        img.loadFromData(data if data is not None else _read_member(z, name, mm))
+    except Exception:
+        # also covers an archive that failed to open or was closed with the viewer
+        pass
+    return _paint_ready(img)
+
+
+class _PageSignals(QtCore.QObject):
+    # (page index, decoded page)
+    ready = QtCore.Signal(int, QtGui.QImage)
+
+
+class _PageTask(QtCore.QRunnable):
+    """Decode a viewer page ahead of time on a worker thread."""
+    def __init__(self, idx: int, z: zipfile.ZipFile, name: str, signals: _PageSignals,
+                 data: Optional[QtCore.QByteArray] = None, mm: Optional[mmap.mmap] = None):
+        super().__init__()
+        self._idx = idx
+        self._zip = z
+        self._name = name
+        self._signals = signals
+        self._data = data
+        self._mm = mm
+
+    def run(self) -> None:
+        img = _read_page_image(self._zip, self._name, self._data, self._mm)
+        try:
+            self._signals.ready.emit(self._idx, img)
+        except RuntimeError:
+            # the viewer was destroyed meanwhile
+            pass
+
+
+class _SaveSignals(QtCore.QObject):
+    # (FileItem, metadata snapshot that was written, success)
+    finished = QtCore.Signal(object, object, bool)
+
+
+class _SaveTask(QtCore.QRunnable):
+    """Rewrite one archive's ComicInfo.xml on a worker thread."""
+    def __init__(self, it: FileItem, signals: _SaveSignals):
+        super().__init__()
+        self._it = it
+        self._path = it.path
+        # snapshot, so edits made while the save runs stay dirty
+        self._meta = dict(it.meta)
+        self._signals = signals
+
+    def run(self) -> None:
+        ok = write_comicinfo_to_zip(self._path, _build_xml_bytes(self._meta))
+        self._signals.finished.emit(self._it, self._meta, ok)
+
+
 class ImageViewer(QtWidgets.QDialog):
-    def __init__(self, pixmaps: List[QtGui.QPixmap], index: int = 0, parent=None):
+    """Page viewer for an archive; pages are read and decoded only when shown.
+
+    Without ``names`` the pages are listed from the viewer's own handle, so
+    the archive is opened and its directory parsed only once.
+    """
+    def __init__(self, path: Path, names: Optional[List[str]] = None, index: int = 0, parent=None):
         super().__init__(parent)
         self.setWindowTitle('이미지 보기')
         # enable maximize button on the dialog
         self.setWindowFlags(self.windowFlags() | QtCore.Qt.Window | QtCore.Qt.WindowMaximizeButtonHint | QtCore.Qt.WindowCloseButtonHint)
         self.resize(800, 600)
 
-        self._pixmaps: List[QtGui.QPixmap] = pixmaps or []
-        self._idx: int = max(0, min(index, len(self._pixmaps) - 1)) if self._pixmaps else 0
+        self._path: Path = path
+        # the archive stays open while the viewer is, so turning a page doesn't reparse it
+        try:
+            self._zip: Optional[zipfile.ZipFile] = zipfile.ZipFile(str(path), 'r')
+        except Exception:
+            self._zip = None
+        # the archive mapped into memory, so uncompressed pages are copied out without zipfile
+        self._mmap: Optional[mmap.mmap] = None
+        if self._zip is not None:
+            try:
+                self._mmap = mmap.mmap(self._zip.fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except Exception:
+                self._mmap = None
+        if names is None:
+            try:
+                names = list(_zip_index(self._zip).images) if self._zip is not None else []
+            except Exception:
+                names = []
+        self._names: List[str] = names
+        self._idx: int = max(0, min(index, len(self._names) - 1)) if self._names else 0
 
         layout = QtWidgets.QVBoxLayout(self)
         self._scroll = QtWidgets.QScrollArea()
@@ -180,11 +654,28 @@ class ImageViewer(QtWidgets.QDialog):
         self.btn_prev.clicked.connect(self._show_prev)
         self.btn_next.clicked.connect(self._show_next)
 
+        # while the window is being resized use fast scaling, then redo it smoothly once idle
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(120)
+        self._resize_timer.timeout.connect(self._rescale_smooth)
+        # (viewport size, page index, transform) of the pixmap currently shown
+        self._last_scale = None
+
+        # recently decoded pages (index -> pixmap), least recently shown first; the
+        # neighbours of the current page are prefetched into it in the background
+        self._pages: "OrderedDict[int, QtGui.QPixmap]" = OrderedDict()
+        self._prefetch_pending = set()
+        # not a child of the dialog: prefetch tasks may still emit after it is deleted on close
+        self._page_signals = _PageSignals()
+        self._page_signals.ready.connect(self._on_page_ready)
+
         # initially show the selected image and focus the label so key events are delivered
-        if self._pixmaps:
-            self._orig_pixmap = self._pixmaps[self._idx]
-        else:
-            self._orig_pixmap = None
+        self._orig_pixmap = None
+        # size of the first page from its image header, until the page itself is decoded
+        self._header_size = QtCore.QSize()
+        if self._names:
+            self._load_first_page()
         QtCore.QTimer.singleShot(0, self._rescale_pixmap)
         QtCore.QTimer.singleShot(0, self._img_label.setFocus)
         QtCore.QTimer.singleShot(0, self._update_nav_buttons)
@@ -213,9 +704,13 @@ class ImageViewer(QtWidgets.QDialog):
     def resizeEvent(self, ev: QtGui.QResizeEvent) -> None:
         super().resizeEvent(ev)
         # rescale image when the dialog is resized
-        self._rescale_pixmap()
+        self._rescale_pixmap(QtCore.Qt.FastTransformation)
+        self._resize_timer.start()
 
-    def _rescale_pixmap(self) -> None:
+    def _rescale_smooth(self) -> None:
+        self._rescale_pixmap(QtCore.Qt.SmoothTransformation)
+
+    def _rescale_pixmap(self, transform: QtCore.Qt.TransformationMode = QtCore.Qt.SmoothTransformation) -> None:
         if not getattr(self, '_orig_pixmap', None):
             return
         if not getattr(self, '_scroll', None) or not getattr(self, '_img_label', None):
@@ -227,33 +722,138 @@ class ImageViewer(QtWidgets.QDialog):
         oh = self._orig_pixmap.height()
         # do not upscale: if original fits within viewport, show original size
         if ow <= vp.width() and oh <= vp.height():
-            self._img_label.setPixmap(self._orig_pixmap)
+            scale = (vp, self._idx, None)
+            if scale != self._last_scale:
+                self._img_label.setPixmap(self._orig_pixmap)
+                self._last_scale = scale
+            return
+        scale = (vp, self._idx, transform)
+        if scale == self._last_scale:
             return
-        scaled = self._orig_pixmap.scaled(vp.width(), vp.height(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        scaled = self._orig_pixmap.scaled(vp.width(), vp.height(), QtCore.Qt.KeepAspectRatio, transform)
         self._img_label.setPixmap(scaled)
+        self._last_scale = scale
+
+    def image_size(self) -> QtCore.QSize:
+        """Return the size of the current page (invalid if it couldn't be read).
+
+        Right after construction this comes from the first page's header,
+        while the page is still being decoded.
+        """
+        return self._orig_pixmap.size() if self._orig_pixmap is not None else self._header_size
+
+    def _load_first_page(self) -> None:
+        # read the first page here but parse only its header, for image_size(); the
+        # bytes are then decoded on a worker like any other page
+        try:
+            data = _read_member(self._zip, self._names[self._idx], self._mmap)
+        except Exception:
+            data = None
+        if data:
+            buf = QtCore.QBuffer()
+            buf.setData(data)
+            buf.open(QtCore.QIODevice.ReadOnly)
+            self._header_size = QtGui.QImageReader(buf).size()
+        self._start_page_task(self._idx, data)
+        self._prefetch()
+
+    def _load_page(self) -> None:
+        """Show the current page from the cache, or decode it.
+
+        A page that isn't cached yet is decoded on a worker; the previous
+        page stays on screen until it arrives (_on_page_ready).
+        """
+        self._last_scale = None
+        self._orig_pixmap = None
+        self._header_size = QtCore.QSize()
+        pix = self._pages.get(self._idx)
+        if pix is not None:
+            self._pages.move_to_end(self._idx)
+            self._orig_pixmap = pix
+        else:
+            self._start_page_task(self._idx)
+        self._prefetch()
+
+    def _set_page_image(self, img: QtGui.QImage) -> None:
+        # show a freshly decoded current page
+        if img.isNull():
+            self._img_label.setText("이미지 로드 실패")
+            return
+        self._orig_pixmap = QtGui.QPixmap.fromImage(img)
+        self._cache_page(self._idx, self._orig_pixmap)
+
+    def _cache_page(self, idx: int, pix: QtGui.QPixmap) -> None:
+        self._pages[idx] = pix
+        # current page, its two neighbours and the page just left
+        while len(self._pages) > 4:
+            self._pages.popitem(last=False)
+
+    def _prefetch(self) -> None:
+        """Decode the pages on either side of the current one ahead of time."""
+        for i in (self._idx - 1, self._idx + 1):
+            if 0 <= i < len(self._names) and i not in self._pages:
+                self._start_page_task(i)
+
+    def _start_page_task(self, idx: int, data: Optional[QtCore.QByteArray] = None) -> None:
+        if idx in self._prefetch_pending:
+            return
+        self._prefetch_pending.add(idx)
+        QtCore.QThreadPool.globalInstance().start(
+            _PageTask(idx, self._zip, self._names[idx], self._page_signals, data, self._mmap))
+
+    def _on_page_ready(self, idx: int, img: QtGui.QImage) -> None:
+        # QImage is decoded on the worker; only the QPixmap conversion happens here
+        self._prefetch_pending.discard(idx)
+        if idx == self._idx:
+            if self._orig_pixmap is None:
+                self._set_page_image(img)
+                self._rescale_pixmap()
+        elif abs(idx - self._idx) == 1 and not img.isNull():
+            self._cache_page(idx, QtGui.QPixmap.fromImage(img))
+        # pages the user has already moved away from are dropped
+
+    def page_count(self) -> int:
+        """Return the number of pages in the archive (0 if it couldn't be opened)."""
+        return len(self._names)
+
+    def done(self, result: int) -> None:
+        # accept(), reject() and close() all end up here
+        self._pages.clear()
+        self._orig_pixmap = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # a prefetch is copying out of it right now; let it go with the last reference
+                pass
+            self._mmap = None
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        super().done(result)
 
     def _show_prev(self) -> None:
-        if not getattr(self, '_pixmaps', None):
+        if not getattr(self, '_names', None):
             return
         if self._idx <= 0:
             return
         self._idx -= 1
-        self._orig_pixmap = self._pixmaps[self._idx]
+        self._load_page()
         self._rescale_pixmap()
         self._update_nav_buttons()
 
     def _show_next(self) -> None:
-        if not getattr(self, '_pixmaps', None):
+        if not getattr(self, '_names', None):
             return
-        if self._idx >= len(self._pixmaps) - 1:
+        if self._idx >= len(self._names) - 1:
             return
         self._idx += 1
-        self._orig_pixmap = self._pixmaps[self._idx]
+        self._load_page()
         self._rescale_pixmap()
         self._update_nav_buttons()
 
     def _update_nav_buttons(self) -> None:
-        total = len(getattr(self, '_pixmaps', []))
+        total = len(getattr(self, '_names', []))
         if total <= 1:
             self.btn_prev.setEnabled(False)
             self.btn_next.setEnabled(False)
@@ -266,6 +866,66 @@ class ImageViewer(QtWidgets.QDialog):
         except Exception:
             pass
 
+class _FilesModel(QtCore.QAbstractTableModel):
+    """File list columns ("*", name, size), read straight from the FileItems."""
+    HEADERS = ("*", "파일명", "크기")
+
+    # (row, new display name) when the name cell is edited; the window does the rename
+    rename_requested = QtCore.Signal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # own copy of the row order, so rows stay valid while MainWindow.files is re-sorted
+        self._files: List[FileItem] = []
+
+    def set_files(self, files: List[FileItem]) -> None:
+        self.beginResetModel()
+        self._files = list(files)
+        self.endResetModel()
+
+    def file_at(self, row: int) -> Optional[FileItem]:
+        return self._files[row] if 0 <= row < len(self._files) else None
+
+    def row_changed(self, row: int, first_col: int = 0, last_col: int = 2) -> None:
+        """Repaint some cells of one row after its FileItem changed."""
+        self.dataChanged.emit(self.index(row, first_col), self.index(row, last_col), [QtCore.Qt.DisplayRole])
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._files)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if role not in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole) or not index.isValid():
+            return None
+        fi = self._files[index.row()]
+        col = index.column()
+        if col == 0:
+            return "*" if fi.dirty else ""
+        if col == 1:
+            return fi.path.stem
+        return fi.size_str
+
+    def setData(self, index: QtCore.QModelIndex, value, role: int = QtCore.Qt.EditRole) -> bool:
+        if role != QtCore.Qt.EditRole or not index.isValid() or index.column() != 1:
+            return False
+        self.rename_requested.emit(index.row(), str(value))
+        self.row_changed(index.row())
+        return True
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        if index.column() == 1:
+            flags |= QtCore.Qt.ItemIsEditable
+        return flags
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
@@ -278,7 +938,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.files: List[FileItem] = []
         self.setAcceptDrops(True)
 
-        self._suppress_table_item_changed = False
+        # list-wide UI updates after edits, debounced so fast typing triggers one pass
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh)
 
         # F2 rename action
         self.rename_action = QtGui.QAction(self)
@@ -297,8 +961,41 @@ class MainWindow(QtWidgets.QMainWindow):
         self.next_action.triggered.connect(self.go_next_file)
         self.addAction(self.next_action)
 
-        # full-size pixmap cache for thumbnail -> full viewer
-        self._full_pixmap = None
+        # scaled thumbnails (limit in KB)
+        QtGui.QPixmapCache.setCacheLimit(65536)
+
+        # covers are decoded on a worker; results older than _thumb_req are dropped
+        self._thumb_pool = QtCore.QThreadPool.globalInstance()
+        self._thumb_req = 0
+        # archive read by each thumbnail task still running, by request id; saves of
+        # such an archive wait for the task to report back, as it holds the file open
+        self._thumb_reading: Dict[int, Path] = {}
+        self._thumb_pending = ""
+        self._thumb_signals = _ThumbSignals(self)
+        self._thumb_signals.ready.connect(self._on_thumb_ready)
+
+        # "전체저장" rewrites archives on its own small pool to overlap I/O without thrashing the disk
+        self._save_pool = QtCore.QThreadPool(self)
+        self._save_pool.setMaxThreadCount(min(os.cpu_count() or 1, 4))
+        self._save_signals = _SaveSignals(self)
+        self._save_signals.finished.connect(self._on_save_finished)
+        self._save_total = 0
+        self._save_done = 0
+        self._save_any = False
+        self._save_failed: List[str] = []
+        # archives queued for or being rewritten by the pool; nothing may open them
+        # meanwhile, since Windows refuses to replace a file that is still open
+        self._saving_paths: set = set()
+        # queued saves held back until a running thumbnail read of the file finishes
+        self._save_deferred: List[FileItem] = []
+
+        # work area of the primary screen, which bounds the viewer's initial size; kept
+        # up to date through signals instead of being queried on every viewer open
+        self._screen: Optional[QtGui.QScreen] = None
+        self._screen_geom = QtCore.QRect()
+        app = QtWidgets.QApplication.instance()
+        app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+        self._on_primary_screen_changed(app.primaryScreen())
 
         self._build_ui()
 
@@ -321,8 +1018,10 @@ class MainWindow(QtWidgets.QMainWindow):
         btn_layout.addWidget(self.btn_clear)
         left_layout.addLayout(btn_layout)
 
-        self.table = QtWidgets.QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["*", "파일명", "크기"])
+        # a model instead of per-cell QTableWidgetItems; cells are read from the FileItems
+        self.table = QtWidgets.QTableView()
+        self._model = _FilesModel(self)
+        self.table.setModel(self._model)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
@@ -332,7 +1031,7 @@ class MainWindow(QtWidgets.QMainWindow):
         header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)
         self.table.setColumnWidth(0, 30)
         left_layout.addWidget(self.table)
-        self.table.itemChanged.connect(self.on_table_item_changed)
+        self._model.rename_requested.connect(self.on_rename_requested)
 
         splitter.addWidget(left)
 
@@ -396,12 +1095,12 @@ class MainWindow(QtWidgets.QMainWindow):
         # connections
         self.btn_load.clicked.connect(self.load_files_dialog)
         self.btn_clear.clicked.connect(self.clear_list)
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.btn_save.clicked.connect(self.save_current)
         self.btn_save_all.clicked.connect(self.save_all)
 
-        for f in self.fields.values():
-            f.textChanged.connect(self.on_field_changed)
+        for key, f in self.fields.items():
+            f.textChanged.connect(lambda v, k=key: self.on_field_changed(k, v))
 
     def load_files_dialog(self):
         paths, _ = QtWidgets.QFileDialog.getOpenFileNames(self, "파일 선택", str(Path.home()), "CBZ/ZIP Files (*.cbz *.zip);;All Files (*)")
@@ -410,88 +1109,77 @@ class MainWindow(QtWidgets.QMainWindow):
         self.load_paths([Path(p) for p in paths])
 
     def load_paths(self, paths: List[Path]):
-        for p in paths:
-            # skip duplicates
-            if any(existing.path == p for existing in self.files):
+        # skip duplicates, both against loaded files and within this batch
+        existing = {fi.path for fi in self.files}
+        new_paths: List[Path] = []
+        for p in dict.fromkeys(paths):
+            if p in existing:
                 continue
+            existing.add(p)
+            new_paths.append(p)
+
+        # ComicInfo.xml is read lazily on selection (see _ensure_meta), so only sizes are needed here
+        stats = _stat_paths(new_paths)
+        for p in new_paths:
             fi = FileItem(p)
-            tree = read_comicinfo_from_zip(p)
-            if tree is not None:
-                fi.has_comicinfo = True
-                fi.meta = self._meta_from_xml(tree)
-                fi.saved_meta = fi.meta.copy()
+            fi.refresh_stat(stats.get(p))
             self.files.append(fi)
 
         # natural sort files by filename so numeric parts sort naturally (1,2,..10)
-        def natural_key(s: str):
-            parts = re.split(r"(\d+)", s)
-            key = []
-            for p in parts:
-                if p.isdigit():
-                    key.append(int(p))
-                else:
-                    key.append(p.lower())
-            return tuple(key)
-
-        self.files.sort(key=lambda fi: natural_key(fi.path.name))
-        self.refresh_table()
-
-    def refresh_table(self):
-        try:
-            selected_rows = [r.row() for r in self.table.selectionModel().selectedRows()]
-            selected_paths = [self.table.item(r, 1).data(QtCore.Qt.UserRole) for r in selected_rows if self.table.item(r, 1) is not None]
-        except Exception:
-            selected_paths = []
-
-        self.table.blockSignals(True)
-        self.table.setRowCount(0)
-        for fi in self.files:
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            star = QtWidgets.QTableWidgetItem("*" if fi.dirty else "")
-            star.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-            display_name = fi.path.stem
-            name = QtWidgets.QTableWidgetItem(display_name)
-            name.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEditable)
-            name.setData(QtCore.Qt.UserRole, str(fi.path))
-            try:
-                size = fi.path.stat().st_size
-                size_mb = size / (1024.0 * 1024.0)
-                size_str = f"{size_mb:.1f} MB"
-            except Exception:
-                size_str = ""
-            size_item = QtWidgets.QTableWidgetItem(size_str)
-            size_item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-            self.table.setItem(r, 0, star)
-            self.table.setItem(r, 1, name)
-            self.table.setItem(r, 2, size_item)
-
-        if selected_paths:
-            self.table.clearSelection()
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, 1)
-                if item and item.data(QtCore.Qt.UserRole) in selected_paths:
-                    self.table.selectRow(row)
-
-        self.table.blockSignals(False)
+        self.files.sort(key=lambda fi: _natural_key(fi.path.name))
+        self._rebuild_table()
+
+    def _rebuild_table(self):
+        """Reset the model; only needed when files are added, removed or reordered."""
+        sel_model = self.table.selectionModel()
+        # the model still has the old row order here, even if self.files was re-sorted
+        selected = {id(self._model.file_at(r.row())) for r in sel_model.selectedRows()}
+
+        sel_model.blockSignals(True)
+        for row, fi in enumerate(self.files):
+            fi.row = row
+        self._model.set_files(self.files)
+
+        if selected:
+            # restore the selection in one call, one range per run of adjacent rows
+            last_col = self._model.columnCount() - 1
+            selection = QtCore.QItemSelection()
+            start = None
+            for row, fi in enumerate(self.files + [None]):
+                hit = fi is not None and id(fi) in selected
+                if hit and start is None:
+                    start = row
+                elif not hit and start is not None:
+                    selection.select(self._model.index(start, 0), self._model.index(row - 1, last_col))
+                    start = None
+            sel_model.select(selection, QtCore.QItemSelectionModel.ClearAndSelect | QtCore.QItemSelectionModel.Rows)
+
+        sel_model.blockSignals(False)
         self.update_status()
 
+    def _set_dirty_mark(self, fi: FileItem):
+        """Repaint the '*' cell of a single row."""
+        self._model.row_changed(fi.row, 0, 0)
+
+    def _refresh_row(self, fi: FileItem):
+        """Repaint a single row, e.g. its dirty mark and size after a save."""
+        self._model.row_changed(fi.row)
+
     def clear_list(self):
         self.files = []
         for f in self.fields.values():
             f.blockSignals(True)
             f.setText("")
             f.blockSignals(False)
-        self.refresh_table()
+        self._rebuild_table()
         self.table.clearSelection()
         self.btn_save.setEnabled(False)
         self.btn_save_all.setEnabled(False)
         self.statusBar().showMessage("파일을 선택하세요")
-        self._full_pixmap = None
-        self.thumb_label.clear()
+        self._clear_thumbnail()
 
     def on_selection_changed(self):
-        rows = {i.row() for i in self.table.selectedIndexes()}
+        rows = {i.row() for i in self.table.selectionModel().selectedIndexes()}
         selected = [self.files[r] for r in sorted(rows)]
         count = len(selected)
         if count == 0:
@@ -500,180 +1188,251 @@ class MainWindow(QtWidgets.QMainWindow):
                 f.setText("")
             self.btn_save.setEnabled(False)
             self.btn_save_all.setEnabled(False)
-            self._full_pixmap = None
-            self.thumb_label.clear()
+            self._clear_thumbnail()
             return
 
-        self.statusBar().showMessage(f"{count}개 파일 선택됨")
+        if not self._save_total:
+            self.statusBar().showMessage(f"{count}개 파일 선택됨")
+        for it in selected:
+            self._ensure_meta(it)
+        # an archive that couldn't be read has no known metadata to edit; an edit
+        # would be overwritten by the retry or drop the unread fields on save
+        unreadable = [it for it in selected if not it.meta_loaded]
+        if unreadable and not self._save_total:
+            self.statusBar().showMessage(f"파일을 읽을 수 없어 편집할 수 없습니다: {unreadable[0].path.name}")
         common = self._common_meta(selected)
         for key, widget in self.fields.items():
             val = common.get(key, "")
             widget.blockSignals(True)
             widget.setText(val)
+            widget.setReadOnly(bool(unreadable))
             widget.blockSignals(False)
 
-        if count == 1:
+        if self._save_total:
+            # both stay disabled until the running "전체저장" has finished
+            pass
+        elif count == 1:
             self.btn_save.setEnabled(selected[0].dirty)
+            self.btn_save_all.setEnabled(any(fi.dirty for fi in self.files))
         else:
             self.btn_save.setEnabled(any(s.dirty for s in selected))
-
-        self.btn_save_all.setEnabled(any(fi.dirty for fi in self.files))
+            self.btn_save_all.setEnabled(any(fi.dirty for fi in self.files))
         self.update_thumbnail()
 
+    def _ensure_meta(self, fi: FileItem):
+        """Parse the file's ComicInfo.xml on first use."""
+        if fi.meta_loaded or fi.path in self._saving_paths:
+            return
+        try:
+            meta = read_archive_info(fi.path, mtime_ns=fi.mtime_ns, size=fi.size)
+        except Exception:
+            # couldn't open it (locked, half-copied, ...); try again on the next selection
+            return
+        if meta is not None:
+            fi.has_comicinfo = True
+            fi.meta = meta
+            fi.saved_meta = fi.meta.copy()
+        fi.meta_loaded = True
+
+    def _on_primary_screen_changed(self, screen: Optional[QtGui.QScreen]):
+        self._screen = screen
+        if screen is not None:
+            screen.availableGeometryChanged.connect(self._update_screen_geom)
+        self._update_screen_geom()
+
+    def _update_screen_geom(self, *_):
+        self._screen_geom = self._screen.availableGeometry() if self._screen is not None else QtCore.QRect()
+
     def _common_meta(self, items: List[FileItem]) -> Dict[str, str]:
-        keys = ["SeriesGroup", "Series", "Title", "Volume", "Number", "Year", "Month", "Day", "Author"]
         common = {}
-        for k in keys:
-            values = []
-            for it in items:
-                v = it.meta.get(k)
-                values.append(v if v is not None else "")
-            first = values[0]
-            if all(v == first for v in values):
-                common[k] = first
-            else:
-                if all(v == "" for v in values):
-                    common[k] = ""
-                else:
+        for k in FIELD_KEYS:
+            # single pass that stops at the first differing value
+            # (values that differ can't all be empty, so that case needs no check)
+            it_iter = iter(items)
+            first = next(it_iter).meta.get(k) or ""
+            for it in it_iter:
+                if (it.meta.get(k) or "") != first:
                     common[k] = "<개별값>"
+                    break
+            else:
+                common[k] = first
         return common
 
-    def _meta_from_xml(self, root: etree._Element) -> Dict[str, str]:
-        out = {}
-        mapping = {
-            "SeriesGroup": "SeriesGroup",
-            "Series": "Series",
-            "Title": "Title",
-            "Volume": "Volume",
-            "Number": "Number",
-            "Year": "Year",
-            "Month": "Month",
-            "Day": "Day",
-            "Penciller": "Penciller",
-            "Inker": "Inker",
-        }
-        for xmlk, tag in mapping.items():
-            el = root.find(tag)
-            if el is not None and el.text:
-                out[xmlk] = el.text
-        author = out.get("Penciller") or out.get("Inker")
-        if author:
-            out["Author"] = author
-        return out
-
-    def on_field_changed(self):
-        # Update only the selected rows' metadata and their dirty/star indicator in-place
-        rows = sorted({i.row() for i in self.table.selectedIndexes()})
+    def on_field_changed(self, key: str, val: str):
+        # Update only the edited field of the selected rows and their dirty/star indicator in-place
+        rows = sorted({i.row() for i in self.table.selectionModel().selectedIndexes()})
         if not rows:
             return
+        if val == "<개별값>":
+            # placeholder for differing values; leave each file's own value alone
+            return
         selected = [self.files[r] for r in rows]
-        cur = {k: v.text() for k, v in self.fields.items()}
+        if not all(it.meta_loaded for it in selected):
+            return
         any_dirty = False
         changed_any = False
 
         # Update model entries for each selected file and update the star column in-place
-        self.table.blockSignals(True)
-        for row, it in zip(rows, selected):
-            changed = False
-            for k, v in cur.items():
-                if v == "<개별값>":
-                    continue
-                old = it.saved_meta.get(k, "")
-                it.meta[k] = v
-                if v != old:
-                    changed = True
+        for it in selected:
+            it.meta[key] = val
+            changed = val != it.saved_meta.get(key, "") or \
+                any(it.meta.get(k, "") != it.saved_meta.get(k, "") for k in FIELD_KEYS)
             if it.dirty != changed:
                 changed_any = True
                 it.dirty = changed
                 # update star cell for this row only
-                star_item = self.table.item(row, 0)
-                if star_item is None:
-                    star_item = QtWidgets.QTableWidgetItem("*" if it.dirty else "")
-                    star_item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-                    self.table.setItem(row, 0, star_item)
-                else:
-                    star_item.setText("*" if it.dirty else "")
+                self._set_dirty_mark(it)
             any_dirty = any_dirty or changed
-        self.table.blockSignals(False)
 
         # update buttons based on dirty state; do not rebuild the whole table to preserve selection
-        self.btn_save.setEnabled(any_dirty)
+        if not self._save_total:
+            self.btn_save.setEnabled(any_dirty)
+        if changed_any:
+            # the list-wide "save all" state only changes when a dirty flag flips
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """(Re)start the debounce timer; the update runs 50 ms after the last edit."""
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        if self._save_total:
+            return
         self.btn_save_all.setEnabled(any(fi.dirty for fi in self.files))
 
     def save_current(self):
-        rows = {i.row() for i in self.table.selectedIndexes()}
+        if self._save_total:
+            return
+        rows = {i.row() for i in self.table.selectionModel().selectedIndexes()}
         selected = [self.files[r] for r in sorted(rows)]
         if not selected:
             return
+        failed = []
         for it in selected:
             if not it.dirty:
                 continue
-            root = self._build_xml_from_meta(it, it.meta)
-            ok = write_comicinfo_to_zip(it.path, root)
-            if ok:
-                it.saved_meta = {k: v for k, v in it.meta.items() if v and v != "<개별값>"}
-                it.dirty = False
-        self.refresh_table()
-        QtWidgets.QMessageBox.information(self, "저장", "저장되었습니다")
+            try:
+                xml = _build_xml_bytes(it.meta)
+            except ValueError as e:
+                failed.append(self._illegal_chars_msg(it, e))
+                continue
+            self._wait_thumb_read(it.path)
+            if write_comicinfo_to_zip(it.path, xml):
+                self._mark_saved(it, it.meta)
+            else:
+                failed.append(it.path.name)
+        self.update_status()
+        if failed:
+            QtWidgets.QMessageBox.warning(self, "저장", "저장하지 못한 파일이 있습니다:\n" + "\n".join(failed))
+        else:
+            QtWidgets.QMessageBox.information(self, "저장", "저장되었습니다")
+
+    def _mark_saved(self, it: FileItem, meta: Dict[str, str]):
+        """Record ``meta`` as the file's on-disk state and update its row."""
+        it.saved_meta = {k: v for k, v in meta.items() if v and v != "<개별값>"}
+        it.dirty = any(it.meta.get(k, "") != it.saved_meta.get(k, "") for k in FIELD_KEYS)
+        _forget_archive(it.path)
+        it.refresh_stat()
+        # the list may have been cleared while a background save was running
+        if 0 <= it.row < len(self.files) and self.files[it.row] is it:
+            self._refresh_row(it)
 
     def save_all(self):
+        if self._save_total:
+            return
         # Gather dirty files first
         dirty_items = [it for it in self.files if it.dirty]
+        if not dirty_items:
+            QtWidgets.QMessageBox.information(self, "저장", "저장할 변경사항이 없습니다")
+            return
+        # values XML can't hold are rejected up front, before anything is queued
+        rejected = []
+        for it in dirty_items:
+            try:
+                _build_xml_bytes(it.meta)
+            except ValueError as e:
+                rejected.append((it, self._illegal_chars_msg(it, e)))
+        if rejected:
+            skip = {id(it) for it, _ in rejected}
+            dirty_items = [it for it in dirty_items if id(it) not in skip]
         total = len(dirty_items)
         if total == 0:
-            QtWidgets.QMessageBox.information(self, "저장", "저장할 변경사항이 없습니다")
+            QtWidgets.QMessageBox.warning(self, "저장", "저장하지 못한 파일이 있습니다:\n"
+                                          + "\n".join(msg for _, msg in rejected))
             return
 
-        # Disable save buttons while operating
+        # Disable save buttons and renaming while operating
         self.btn_save_all.setEnabled(False)
         self.btn_save.setEnabled(False)
-
-        any_saved = False
-        try:
-            for idx, it in enumerate(dirty_items, start=1):
-                # Update status bar with progress like '(3/16) 저장중...'
-                self.statusBar().showMessage(f"({idx}/{total}) 저장중...")
-                QtWidgets.QApplication.processEvents()
-
-                root = self._build_xml_from_meta(it, it.meta)
-                ok = write_comicinfo_to_zip(it.path, root)
-                if ok:
-                    it.saved_meta = {k: v for k, v in it.meta.items() if v and v != "<개별값>"}
-                    it.dirty = False
-                    any_saved = True
-
-            # final refresh and message
-            self.refresh_table()
-            if any_saved:
-                QtWidgets.QMessageBox.information(self, "저장", "저장되었습니다")
+        self._save_total = total
+        self._save_done = 0
+        self._save_any = False
+        self._save_failed = [msg for _, msg in rejected]
+        self._saving_paths = {it.path for it in dirty_items}
+        # Update status bar with progress like '(3/16) 저장중...'
+        self.statusBar().showMessage(f"(0/{total}) 저장중...")
+        self._save_deferred = []
+        for it in dirty_items:
+            if self._thumb_busy(it.path):
+                # a cover is still being read from it; started from _on_thumb_ready
+                self._save_deferred.append(it)
             else:
-                QtWidgets.QMessageBox.information(self, "저장", "저장할 변경사항이 없습니다")
-        finally:
-            # Restore status and button states
-            self.update_status()
-            self.btn_save_all.setEnabled(any(fi.dirty for fi in self.files))
-            self.btn_save.setEnabled(False)
+                self._save_pool.start(_SaveTask(it, self._save_signals))
 
-    def _build_xml_from_meta(self, it: FileItem, cur: Dict[str, str]) -> etree._Element:
-        root = etree.Element("ComicInfo")
-        def add(tag, value):
-            if value and value != "<개별값>":
-                el = etree.SubElement(root, tag)
-                el.text = str(value)
-        add("SeriesGroup", cur.get("SeriesGroup", ""))
-        add("Series", cur.get("Series", ""))
-        add("Title", cur.get("Title", ""))
-        add("Volume", cur.get("Volume", ""))
-        add("Number", cur.get("Number", ""))
-        add("Year", cur.get("Year", ""))
-        add("Month", cur.get("Month", ""))
-        add("Day", cur.get("Day", ""))
-        author = cur.get("Author", "")
-        if author and author != "<개별값>":
-            add("Penciller", author)
-            add("Inker", author)
-        return root
+    def _thumb_busy(self, path: Path) -> bool:
+        return path in self._thumb_reading.values()
 
+    def _start_deferred_saves(self, path: Path):
+        if not self._save_deferred or self._thumb_busy(path):
+            return
+        ready = [it for it in self._save_deferred if it.path == path]
+        if ready:
+            self._save_deferred = [it for it in self._save_deferred if it.path != path]
+            for it in ready:
+                self._save_pool.start(_SaveTask(it, self._save_signals))
+
+    def _wait_thumb_read(self, path: Path):
+        """Block until no thumbnail task is reading ``path`` any more.
+
+        Only posted events are handled meanwhile, not user input; cover reads
+        are short and _ThumbTask always reports back.
+        """
+        while self._thumb_busy(path):
+            QtCore.QCoreApplication.processEvents(
+                QtCore.QEventLoop.ExcludeUserInputEvents | QtCore.QEventLoop.WaitForMoreEvents)
+
+    @staticmethod
+    def _illegal_chars_msg(it: FileItem, err: ValueError) -> str:
+        return f"{it.path.name} ({err}: XML에 쓸 수 없는 문자가 있습니다)"
+
+    def _on_save_finished(self, it: FileItem, meta: Dict[str, str], ok: bool):
+        self._save_done += 1
+        self._saving_paths.discard(it.path)
+        if ok:
+            self._mark_saved(it, meta)
+            self._save_any = True
+        else:
+            self._save_failed.append(it.path.name)
+        if it is self._cover_file():
+            # the thumbnail was held back while the file was being rewritten
+            self.update_thumbnail()
+        if self._save_done < self._save_total:
+            self.statusBar().showMessage(f"({self._save_done}/{self._save_total}) 저장중...")
+            return
+
+        self._save_total = 0
+        # Restore status and button states
+        self.update_status()
+        self._do_refresh()
+        rows = {i.row() for i in self.table.selectionModel().selectedIndexes()}
+        self.btn_save.setEnabled(any(self.files[r].dirty for r in rows))
+        # final message
+        if self._save_failed:
+            QtWidgets.QMessageBox.warning(self, "저장", "저장하지 못한 파일이 있습니다:\n" + "\n".join(self._save_failed))
+        elif self._save_any:
+            QtWidgets.QMessageBox.information(self, "저장", "저장되었습니다")
+        else:
+            QtWidgets.QMessageBox.information(self, "저장", "저장할 변경사항이 없습니다")
 
     def update_status(self):
         sel = len(self.table.selectionModel().selectedRows())
@@ -682,6 +1441,17 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self.statusBar().showMessage(f"{sel}개 파일 선택됨")
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # let background saves finish so no archive is left mid-rewrite; saves still
+        # held for a cover read are started once the reads are done
+        if self._save_deferred:
+            self._thumb_pool.waitForDone()
+            for it in self._save_deferred:
+                self._save_pool.start(_SaveTask(it, self._save_signals))
+            self._save_deferred = []
+        self._save_pool.waitForDone()
+        super().closeEvent(event)
+
     # Drag & drop support
     def dragEnterEvent(self, event: QtGui.QDragEnterEvent) -> None:
         if event.mimeData().hasUrls():
@@ -702,15 +1472,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # start rename for selected row (F2)
     def start_rename(self):
+        if self._save_total:
+            # files are being rewritten in the background
+            return
         rows = [r.row() for r in self.table.selectionModel().selectedRows()]
         if not rows:
             return
-        row = rows[0]
-        item = self.table.item(row, 1)
-        if item is None:
-            return
-        # make sure item is editable and start editing
-        self.table.editItem(item)
+        # start editing the name cell (the view itself has no edit triggers)
+        self.table.edit(self._model.index(rows[0], 1))
 
     def go_next_file(self):
         """Select the next file in the table (if any)."""
@@ -719,18 +1488,16 @@ class MainWindow(QtWidgets.QMainWindow):
             focus = QtWidgets.QApplication.focusWidget()
             if not isinstance(focus, QtWidgets.QLineEdit) or focus not in self.fields.values():
                 return
-            rows = sorted({i.row() for i in self.table.selectedIndexes()})
+            rows = sorted({i.row() for i in self.table.selectionModel().selectedIndexes()})
             if not rows:
                 return
             row = rows[0]
-            if row >= self.table.rowCount() - 1:
+            if row >= self._model.rowCount() - 1:
                 return
             target = row + 1
             self.table.clearSelection()
             self.table.selectRow(target)
-            item = self.table.item(target, 1)
-            if item:
-                self.table.scrollToItem(item, QtWidgets.QAbstractItemView.PositionAtCenter)
+            self.table.scrollTo(self._model.index(target, 1), QtWidgets.QAbstractItemView.PositionAtCenter)
         except Exception:
             return
 
@@ -741,7 +1508,7 @@ class MainWindow(QtWidgets.QMainWindow):
             focus = QtWidgets.QApplication.focusWidget()
             if not isinstance(focus, QtWidgets.QLineEdit) or focus not in self.fields.values():
                 return
-            rows = sorted({i.row() for i in self.table.selectedIndexes()})
+            rows = sorted({i.row() for i in self.table.selectionModel().selectedIndexes()})
             if not rows:
                 return
             row = rows[0]
@@ -750,153 +1517,162 @@ class MainWindow(QtWidgets.QMainWindow):
             target = row - 1
             self.table.clearSelection()
             self.table.selectRow(target)
-            item = self.table.item(target, 1)
-            if item:
-                self.table.scrollToItem(item, QtWidgets.QAbstractItemView.PositionAtCenter)
+            self.table.scrollTo(self._model.index(target, 1), QtWidgets.QAbstractItemView.PositionAtCenter)
         except Exception:
             return
 
-    def on_table_item_changed(self, item: QtWidgets.QTableWidgetItem):
+    def on_rename_requested(self, row: int, new_display: str):
         # handle rename commits when user edits filename cell (col 1)
-        if self._suppress_table_item_changed:
-            return
-        if item.column() != 1:
-            return
-
-        new_display = item.text()
-        full_path_str = item.data(QtCore.Qt.UserRole)
-        if not full_path_str:
+        fi = self._model.file_at(row)
+        if fi is None:
             return
-        old_path = Path(full_path_str)
-        new_name = new_display + old_path.suffix
-        new_path = old_path.with_name(new_name)
+        full_path_str = str(fi.path)
+        # plain os.path on the path string; a Path is built once, for the model
+        new_path_str = os.path.join(os.path.dirname(full_path_str),
+                                    new_display + os.path.splitext(full_path_str)[1])
 
         # if nothing changed, ignore
-        if new_path == old_path:
+        if new_path_str == full_path_str:
             return
 
-        if new_path.exists():
-            QtWidgets.QMessageBox.warning(self, "이름 변경 실패", f"대상 파일이 이미 존재합니다: {new_path}")
-            # revert display to old stem
-            self._suppress_table_item_changed = True
-            item.setText(old_path.stem)
-            self._suppress_table_item_changed = False
+        # on failure the cell keeps showing the old name, read from fi.path
+        if os.path.exists(new_path_str):
+            QtWidgets.QMessageBox.warning(self, "이름 변경 실패", f"대상 파일이 이미 존재합니다: {new_path_str}")
             return
 
         try:
-            old_path.replace(new_path)
+            os.replace(full_path_str, new_path_str)
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "이름 변경 실패", f"이름 변경 중 오류가 발생했습니다: {e}")
-            self._suppress_table_item_changed = True
-            item.setText(old_path.stem)
-            self._suppress_table_item_changed = False
             return
 
-        # success: update our model entry that matches the old path
-        for fi in self.files:
-            if fi.path == old_path:
-                fi.path = new_path
-                break
-
-        # update the UserRole to new full path
-        self._suppress_table_item_changed = True
-        item.setData(QtCore.Qt.UserRole, str(new_path))
-        # update size column
-        try:
-            size = new_path.stat().st_size
-            size_mb = size / (1024.0 * 1024.0)
-            size_str = f"{size_mb:.1f} MB"
-        except Exception:
-            size_str = ""
-        size_item = self.table.item(item.row(), 2)
-        if size_item:
-            size_item.setText(size_str)
-        self._suppress_table_item_changed = False
+        # success: update our model entry
+        # drop cached thumbnails for the old name (rename keeps the mtime)
+        QtGui.QPixmapCache.remove(self._thumb_key(fi.path, fi.mtime_ns))
+        fi.path = Path(new_path_str)
+        fi.refresh_stat()
+        # update name and size columns
+        self._refresh_row(fi)
+
+    def _cover_file(self) -> Optional[FileItem]:
+        """Return the selected file whose cover is shown (and opened in the viewer).
+
+        That is the current row, found in O(1); only when it isn't selected
+        (e.g. after Ctrl+click deselected it) are the selected rows listed.
+        """
+        sel_model = self.table.selectionModel()
+        mi = self.table.currentIndex()
+        if mi.isValid() and sel_model.isRowSelected(mi.row(), QtCore.QModelIndex()):
+            row = mi.row()
+        else:
+            rows = sel_model.selectedRows()
+            if not rows:
+                return None
+            row = rows[0].row()
+        return self.files[row] if 0 <= row < len(self.files) else None
 
     def update_thumbnail(self):
-        # show thumbnail for first selected file (if any)
-        rows = [r.row() for r in self.table.selectionModel().selectedRows()]
-        if not rows:
-            self._full_pixmap = None
-            self.thumb_label.clear()
+        # show thumbnail for the current selected file (if any)
+        fi = self._cover_file()
+        if fi is None:
+            self._clear_thumbnail()
             return
-        first = rows[0]
-        try:
-            fi = self.files[first]
-        except Exception:
-            self._full_pixmap = None
-            self.thumb_label.clear()
+
+        # a new request supersedes any cover still being decoded
+        self._thumb_req += 1
+
+        # scaled thumbnails are cached per (path, mtime, label size)
+        key = self._thumb_key(fi.path, fi.mtime_ns)
+        thumb = QtGui.QPixmapCache.find(key)
+        if thumb is not None:
+            self.thumb_label.setPixmap(thumb)
+            return
+        if fi.path in self._saving_paths:
+            # read again from _on_save_finished once the file has been rewritten
+            self.thumb_label.setText("저장중...")
             return
 
-        data = get_first_image_from_zip(fi.path)
-        if not data:
-            self._full_pixmap = None
+        # extract and decode off the UI thread; _on_thumb_ready picks up the result
+        self._thumb_pending = key
+        self._thumb_reading[self._thumb_req] = fi.path
+        self._thumb_pool.start(_ThumbTask(self._thumb_req, fi.path, self.thumb_label.size(),
+                                          self._thumb_signals))
+
+    def _on_thumb_ready(self, req: int, img: QtGui.QImage, found: bool):
+        path = self._thumb_reading.pop(req, None)
+        if path is not None:
+            self._start_deferred_saves(path)
+        if req != self._thumb_req:
+            # stale result for a file that is no longer selected
+            return
+        if not found:
             self.thumb_label.setText("썸네일 없음")
             return
-
-        pix = QtGui.QPixmap()
-        ok = pix.loadFromData(data)
-        if not ok or pix.isNull():
-            self._full_pixmap = None
+        if img.isNull():
             self.thumb_label.setText("썸네일 로드 실패")
             return
-
-        self._full_pixmap = pix
-        # scale for thumbnail area while preserving aspect ratio
-        thumb = pix.scaled(self.thumb_label.width(), self.thumb_label.height(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        thumb = QtGui.QPixmap.fromImage(img)
+        QtGui.QPixmapCache.insert(self._thumb_pending, thumb)
         self.thumb_label.setPixmap(thumb)
+
+    def _clear_thumbnail(self):
+        # also invalidates any cover still being decoded
+        self._thumb_req += 1
+        self.thumb_label.clear()
+
+    def _thumb_key(self, path: Path, mtime_ns: int) -> str:
+        """Return the QPixmapCache key for an archive's thumbnail at the current label size."""
+        return f"thumb:{path}:{mtime_ns}:{self.thumb_label.width()}x{self.thumb_label.height()}"
+
     def show_full_image(self):
-        # load all images from the currently selected archive and show viewer with navigation
-        rows = [r.row() for r in self.table.selectionModel().selectedRows()]
-        if not rows:
+        # show the currently selected archive's pages in the viewer with navigation
+        fi = self._cover_file()
+        if fi is None:
             return
-        idx = rows[0]
-        try:
-            fi = self.files[idx]
-        except Exception:
+        if fi.path in self._saving_paths:
+            self.statusBar().showMessage("저장 중인 파일은 열 수 없습니다")
             return
 
-        img_bytes_list = get_image_bytes_list_from_zip(fi.path)
-        if not img_bytes_list:
+        # open viewer on the archive's pages, start at first image; pages decode on demand
+        dlg = ImageViewer(fi.path, index=0, parent=self)
+        if not dlg.page_count():
+            # nothing to show; done() closes the viewer's handle
+            dlg.reject()
+            dlg.deleteLater()
             return
+        # free the dialog (and its decoded pages) once it closes instead of keeping it under self
+        dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        size = dlg.image_size()
+        if size.isValid():
+            # open dialog at current image size but not larger than screen
+            scr = self._screen_geom
+            ow = size.width()
+            oh = size.height()
+            w = min(ow, scr.width()) if scr.isValid() else ow
+            h = min(oh, scr.height()) if scr.isValid() else oh
+            dlg.resize(w, h)
+        dlg.exec()
 
-        pixmaps: List[QtGui.QPixmap] = []
-        for b in img_bytes_list:
-            p = QtGui.QPixmap()
-            if p.loadFromData(b):
-                pixmaps.append(p)
-        if not pixmaps:
-            return
 
-        # open viewer with list of pixmaps, start at first image
-        dlg = ImageViewer(pixmaps, index=0, parent=self)
-        # open dialog at current image size but not larger than screen
-        scr = QtWidgets.QApplication.primaryScreen().availableGeometry()
-        ow = pixmaps[0].width()
-        oh = pixmaps[0].height()
-        w = min(ow, scr.width())
-        h = min(oh, scr.height())
-        dlg.resize(w, h)
-        dlg.exec()
+@functools.lru_cache(maxsize=1)
+def _resolved_icon_path() -> Optional[str]:
+    """Return the application icon file, or None if there is none."""
+    # When running as a PyInstaller onefile bundle, data files are unpacked to sys._MEIPASS;
+    # build_exe.bat always bundles CoTag.ico there, so no stat is needed
+    meipass = getattr(sys, '_MEIPASS', None)
+    if getattr(sys, 'frozen', False) and meipass:
+        return os.path.join(meipass, 'CoTag.ico')
+    # fallback to project resource folder when running from source
+    candidate = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'resource', 'CoTag.ico')
+    return candidate if os.path.isfile(candidate) else None
 
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
     # Ensure the application (and taskbar) uses our icon when possible.
-    # When running as a PyInstaller onefile bundle, data files are unpacked to sys._MEIPASS.
-    icon_path = None
-    if getattr(sys, 'frozen', False) and getattr(sys, '_MEIPASS', None):
-        candidate = Path(sys._MEIPASS) / 'CoTag.ico'
-        if candidate.exists():
-            icon_path = candidate
-    if icon_path is None:
-        # fallback to project resource folder when running from source
-        project_root = Path(__file__).resolve().parent.parent
-        candidate = project_root / 'resource' / 'CoTag.ico'
-        if candidate.exists():
-            icon_path = candidate
+    icon_path = _resolved_icon_path()
     if icon_path:
-        app.setWindowIcon(QtGui.QIcon(str(icon_path)))
+        app.setWindowIcon(QtGui.QIcon(icon_path))
     w = MainWindow()
     w.show()
     sys.exit(app.exec())